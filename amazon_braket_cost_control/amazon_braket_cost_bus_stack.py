@@ -1,15 +1,40 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: MIT-0
 
+import functools
 from constructs import Construct
-from aws_cdk import (Stack, aws_events, aws_iam)
+from aws_cdk import (App, Environment, Stack, aws_events, aws_iam)
+from amazon_braket_cost_control.solution import apply_solution_aspects, get_solution_id
+
+DEFAULT_EVENT_BUS_NAME = 'braket-cost-control-bus'
+_STACK_KWARGS = ('event_bus_name', 'braket_regions')
+
+
+@functools.lru_cache(maxsize=None)
+def _default_event_bus_arns(account_id: str, regions: tuple) -> tuple:
+    return tuple(f'arn:aws:events:{region}:{account_id}:event-bus/default' for region in regions)
+
+
+def _build_region_restrict_statement(event_bus_arn: str, account_id: str, regions: tuple) -> aws_iam.PolicyStatement:
+    return aws_iam.PolicyStatement(
+        sid='restrict-regions',
+        effect=aws_iam.Effect.ALLOW,
+        principals=[aws_iam.AccountRootPrincipal()],
+        actions=['events:PutEvents'],
+        resources=[event_bus_arn],
+        conditions={
+            'ArnEquals': {
+                'aws:SourceArn': list(_default_event_bus_arns(account_id, regions))
+            }
+        }
+    )
 
 
 class AmazonBraketCostBusStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
 
-        event_bus_name = kwargs.pop('event_bus_name')
-        braket_regions = kwargs.pop('braket_regions')
+        event_bus_name, braket_regions = (kwargs.pop(key) for key in _STACK_KWARGS)
+        braket_regions = tuple(sorted(set(braket_regions)))
 
         super().__init__(scope, construct_id, **kwargs)
 
@@ -18,21 +43,28 @@ class AmazonBraketCostBusStack(Stack):
             'braket-central-bus',
             event_bus_name=event_bus_name
         )
-        event_bus.add_to_resource_policy(aws_iam.PolicyStatement(
-            sid='restrict-regions',
-            effect=aws_iam.Effect.ALLOW,
-            principals=[aws_iam.AccountRootPrincipal()],
-            actions=['events:PutEvents'],
-            resources=[event_bus.event_bus_arn],
-            conditions={
-                'ArnEquals': {
-                    'aws:SourceArn': [
-                        'arn:aws:events:{region}:{account_id}:event-bus/default'.format(
-                            region=region,
-                            account_id=self.account
-                        ) for region in braket_regions
-                    ]
-                }
-            }
+        event_bus.add_to_resource_policy(
+            _build_region_restrict_statement(event_bus.event_bus_arn, self.account, braket_regions)
+        )
+
+
+def build_bus_app(event_bus_name: str = DEFAULT_EVENT_BUS_NAME, braket_regions: list = None) -> App:
+    """Build a CDK app containing only the central event bus stack.
+
+    Account, primary region and, unless given, the Braket regions are read from the CDK context in cdk.json. The resources
+    are tagged and checked the same way as in the full app.
+    """
+    app = App()
+    AmazonBraketCostBusStack(
+        app,
+        'AmazonBraketCentralEventBusStack',
+        env=Environment(account=app.node.try_get_context('awsAccountId'), region=app.node.try_get_context('primaryRegion')),
+        event_bus_name=event_bus_name,
+        braket_regions=braket_regions or app.node.try_get_context('braketRegions')
+    )
+    apply_solution_aspects(app, solution_id=get_solution_id(app))
+    return app
+
 
-        ))
+if __name__ == '__main__':
+    build_bus_app().synth()
@@ -1,8 +1,10 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: MIT-0
 
+import json
 import pathlib
 from aws_cdk import (
+    BundlingOptions,
     Duration,
     Stack,
     aws_cloudwatch,
@@ -15,12 +17,56 @@ from aws_cdk import (
     aws_lambda_event_sources,
     aws_logs,
     aws_sns,
-    aws_sns_subscriptions
+    aws_sns_subscriptions,
+    aws_sqs,
+    aws_ssm
 )
 from constructs import Construct
 from cdk_nag import NagSuppressions
 
 
+COST_ALARM_EVALUATION_WINDOW = Duration.hours(24)
+OPERATIONAL_ALARM_EVALUATION_WINDOW = Duration.hours(1)
+
+
+def _lambda_asset(name: str) -> str:
+    return pathlib.Path(__file__).parent.parent.joinpath('lambda').joinpath(name).resolve().as_posix()
+
+
+def _evaluation_periods(window: Duration, period: Duration) -> int:
+    return int(window.to_minutes() / period.to_minutes())
+
+
+def _lambda_errors_widget(lambda_function: aws_lambda.IFunction, alarm: aws_cloudwatch.Alarm) -> aws_cloudwatch.AlarmWidget:
+    return aws_cloudwatch.AlarmWidget(
+        title='{} Lambda Invocation Errors'.format(lambda_function.function_name),
+        left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=1.5, show_units=True),
+        alarm=alarm,
+        width=8,
+        height=4
+    )
+
+
+def _lambda_report_widget(title: str, lambda_functions: list, value: str) -> aws_cloudwatch.LogQueryWidget:
+    # Statistics of a REPORT log line value of all functions in a single query grouped by log group
+    return aws_cloudwatch.LogQueryWidget(
+        title=title,
+        log_group_names=[lambda_function.log_group.log_group_name for lambda_function in lambda_functions],
+        query_lines=[
+            'fields @message, @log',
+            'filter @type = "REPORT"',
+            'stats '
+            'max({value}) as max,'
+            'avg({value}) as avg,'
+            'min({value}) as min '
+            'by @log'.format(value=value)
+        ],
+        view=aws_cloudwatch.LogQueryVisualizationType.TABLE,
+        width=24,
+        height=4,
+    )
+
+
 class AmazonBraketCostControlStack(Stack):
 
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
@@ -34,10 +80,26 @@ class AmazonBraketCostControlStack(Stack):
         role_names_to_control = kwargs.pop('role_names_to_control')
         group_names_to_control = kwargs.pop('group_names_to_control')
         user_names_to_control = kwargs.pop('user_names_to_control')
+        task_logger_reserved_concurrency = kwargs.pop('task_logger_reserved_concurrency')
+        cost_meter_reserved_concurrency = kwargs.pop('cost_meter_reserved_concurrency')
+        cost_control_reserved_concurrency = kwargs.pop('cost_control_reserved_concurrency')
+        cost_explorer_reserved_concurrency = kwargs.pop('cost_explorer_reserved_concurrency')
+        task_result_bucket_names = kwargs.pop('task_result_bucket_names')
 
         super().__init__(scope, construct_id, **kwargs)
 
         braket_event_bus = aws_events.EventBus.from_event_bus_name(self, 'braket-event-bus', event_bus_name)
+        aws_events.Archive(
+            self,
+            'braket-events-archive',
+            archive_name='braket-cost-control-events',
+            description='Amazon Braket events received by the cost control solution',
+            source_event_bus=braket_event_bus,
+            event_pattern=aws_events.EventPattern(
+                source=['aws.braket']
+            ),
+            retention=Duration.days(int(task_item_ttl_days))
+        )
 
         task_creation_rule = aws_events.Rule(
             self,
@@ -63,7 +125,17 @@ class AmazonBraketCostControlStack(Stack):
                 detail_type=['Braket Task State Change'],
                 detail={
                     'eventName': ['MODIFY'],
-                    'status': ['RUNNING', 'COMPLETED']
+                    # Simulator task cost is recorded on completion only, QPU task cost as soon as the task is running
+                    '$or': [
+                        {
+                            'status': ['COMPLETED'],
+                            'deviceArn': [{'prefix': 'arn:aws:braket:'}]
+                        },
+                        {
+                            'status': ['RUNNING'],
+                            'deviceArn': [{'wildcard': 'arn:aws:braket:*:*:device/qpu/*'}]
+                        }
+                    ]
                 }
             ),
             enabled=True,
@@ -82,7 +154,9 @@ class AmazonBraketCostControlStack(Stack):
             ),
             billing_mode=aws_dynamodb.BillingMode.PAY_PER_REQUEST,
             stream=aws_dynamodb.StreamViewType.NEW_AND_OLD_IMAGES,
-            time_to_live_attribute=ttl_attribute_name
+            time_to_live_attribute=ttl_attribute_name,
+            deletion_protection=True,
+            point_in_time_recovery=True
         )
 
         cost_table = aws_dynamodb.Table(
@@ -94,33 +168,26 @@ class AmazonBraketCostControlStack(Stack):
                 type=aws_dynamodb.AttributeType.STRING
             ),
             billing_mode=aws_dynamodb.BillingMode.PAY_PER_REQUEST,
+            deletion_protection=True,
+            point_in_time_recovery=True
         )
 
         aws_managed_lambda_execution_role = aws_iam.ManagedPolicy.from_aws_managed_policy_name('service-role/AWSLambdaBasicExecutionRole')
-        log_retention_role = aws_iam.Role(
+        powertools_layer = aws_lambda.LayerVersion(
             self,
-            'log-retention-role',
-            role_name='braket-log-retention-role',
-            assumed_by=aws_iam.ServicePrincipal('lambda.amazonaws.com'),
-            path='/service-role/',
-            managed_policies=[aws_managed_lambda_execution_role],
-            inline_policies={'log-retention-policy': aws_iam.PolicyDocument(statements=[
-                aws_iam.PolicyStatement(
-                    effect=aws_iam.Effect.ALLOW,
-                    actions=[
-                        'logs:DeleteRetentionPolicy',
-                        'logs:PutRetentionPolicy'
-                    ],
-                    resources=['*']
+            'powertools-layer',
+            layer_version_name='braket-cost-control-powertools',
+            description='AWS Lambda Powertools for Python and dependencies shared by the cost control functions',
+            code=aws_lambda.Code.from_asset(
+                path=_lambda_asset('powertools_layer'),
+                bundling=BundlingOptions(
+                    image=aws_lambda.Runtime.PYTHON_3_12.bundling_image,
+                    platform='linux/arm64',
+                    command=['bash', '-c', 'pip install -r requirements.txt -t /asset-output/python'],
                 ),
-            ])}
-        ).without_policy_updates()
-        NagSuppressions.add_resource_suppressions(
-            construct=log_retention_role,
-            suppressions=[
-                {'id': 'AwsSolutions-IAM4', 'reason': 'Intentional use of AWSLambdaBasicExecutionRole'},
-                {'id': 'AwsSolutions-IAM5', 'reason': 'Used wildcards required for functionality'},
-            ],
+            ),
+            compatible_runtimes=[aws_lambda.Runtime.PYTHON_3_12],
+            compatible_architectures=[aws_lambda.Architecture.ARM_64],
         )
 
         task_logger_lambda_role = aws_iam.Role(
@@ -139,7 +206,7 @@ class AmazonBraketCostControlStack(Stack):
                 aws_iam.PolicyStatement(
                     effect=aws_iam.Effect.ALLOW,
                     actions=['s3:GetObject'],
-                    resources=['arn:aws:s3:::*/*']
+                    resources=['arn:aws:s3:::{}/*'.format(bucket_name) for bucket_name in task_result_bucket_names]
                 ),
                 aws_iam.PolicyStatement(
                     effect=aws_iam.Effect.ALLOW,
@@ -155,23 +222,19 @@ class AmazonBraketCostControlStack(Stack):
                 {'id': 'AwsSolutions-IAM5', 'reason': 'Used wildcards required for functionality'},
             ],
         )
+        task_logger_log_group = aws_logs.LogGroup(
+            self,
+            'task-logger-log-group',
+            retention=aws_logs.RetentionDays.ONE_MONTH
+        )
         task_logger_lambda = aws_lambda.DockerImageFunction(
             self,
             'task-logger-lambda',
             function_name='braket-cost-control-task-logger',
             role=task_logger_lambda_role,
-            code=aws_lambda.DockerImageCode.from_image_asset(
-                directory=pathlib.Path(__file__)
-                .parent
-                .parent
-                .joinpath('lambda')
-                .joinpath('quantum_task_logger')
-                .resolve()
-                .as_posix(),
-            ),
+            code=aws_lambda.DockerImageCode.from_image_asset(directory=_lambda_asset('quantum_task_logger')),
             architecture=aws_lambda.Architecture.ARM_64,
-            log_retention=aws_logs.RetentionDays.ONE_MONTH,
-            log_retention_role=log_retention_role,
+            log_group=task_logger_log_group,
             environment={
                 'TAG_KEY': tag_key,
                 'SOLUTION_ID': solution_id,
@@ -181,12 +244,29 @@ class AmazonBraketCostControlStack(Stack):
                 'LOG_LEVEL': 'DEBUG',
                 'POWERTOOLS_SERVICE_NAME': 'task logger'
             },
-            memory_size=512,
+            # Memory sizes, and with them the allocated vCPU share, can be calibrated per function with
+            # AWS Lambda Power Tuning (https://github.com/alexcasalboni/aws-lambda-power-tuning)
+            memory_size=1024,
+            reserved_concurrent_executions=task_logger_reserved_concurrency,
             timeout=Duration.seconds(120),
         )
         task_state_change_rule.add_target(aws_events_targets.LambdaFunction(task_logger_lambda))
         task_creation_rule.add_target(aws_events_targets.LambdaFunction(task_logger_lambda))
 
+        cost_meter_failure_queue = aws_sqs.Queue(
+            self,
+            'cost-meter-failure-queue',
+            queue_name='braket-cost-control-meter-failures',
+            encryption=aws_sqs.QueueEncryption.SQS_MANAGED,
+            enforce_ssl=True,
+            retention_period=Duration.days(14)
+        )
+        NagSuppressions.add_resource_suppressions(
+            construct=cost_meter_failure_queue,
+            suppressions=[
+                {'id': 'AwsSolutions-SQS3', 'reason': 'The queue is the on-failure destination of the cost meter event source'},
+            ]
+        )
         cost_meter_lambda_role = aws_iam.Role(
             self,
             'cost-meter-lambda-role',
@@ -200,11 +280,6 @@ class AmazonBraketCostControlStack(Stack):
                     actions=['dynamodb:UpdateItem'],
                     resources=[cost_table.table_arn]
                 ),
-                aws_iam.PolicyStatement(
-                    effect=aws_iam.Effect.ALLOW,
-                    actions=['cloudwatch:PutMetricData'],
-                    resources=['*']
-                ),
                 aws_iam.PolicyStatement(
                     effect=aws_iam.Effect.ALLOW,
                     actions=['dynamodb:ListStreams'],
@@ -219,6 +294,11 @@ class AmazonBraketCostControlStack(Stack):
                     ],
                     resources=[tasks_table.table_stream_arn]
                 ),
+                aws_iam.PolicyStatement(
+                    effect=aws_iam.Effect.ALLOW,
+                    actions=['sqs:SendMessage'],
+                    resources=[cost_meter_failure_queue.queue_arn]
+                ),
             ])}
         ).without_policy_updates()
         NagSuppressions.add_resource_suppressions(
@@ -228,37 +308,45 @@ class AmazonBraketCostControlStack(Stack):
                 {'id': 'AwsSolutions-IAM5', 'reason': 'Used wildcards required for functionality'},
             ]
         )
-        cost_meter_lambda = aws_lambda.DockerImageFunction(
+        cost_meter_log_group = aws_logs.LogGroup(
+            self,
+            'cost-meter-log-group',
+            retention=aws_logs.RetentionDays.ONE_MONTH
+        )
+        cost_meter_lambda = aws_lambda.Function(
             self,
             'cost-meter-lambda',
             function_name='braket-cost-control-meter',
             role=cost_meter_lambda_role,
-            code=aws_lambda.DockerImageCode.from_image_asset(
-                directory=pathlib.Path(__file__)
-                .parent
-                .parent
-                .joinpath('lambda')
-                .joinpath('quantum_task_cost_meter')
-                .resolve()
-                .as_posix()
-            ),
+            code=aws_lambda.Code.from_asset(path=_lambda_asset('quantum_task_cost_meter')),
+            handler='index.handler',
+            runtime=aws_lambda.Runtime.PYTHON_3_12,
+            layers=[powertools_layer],
             architecture=aws_lambda.Architecture.ARM_64,
-            log_retention=aws_logs.RetentionDays.ONE_MONTH,
-            log_retention_role=log_retention_role,
+            log_group=cost_meter_log_group,
             environment={
                 'COST_TABLE_NAME': cost_table.table_name,
-                'LOG_LEVEL': 'DEBUG',
+                'LOG_LEVEL': 'INFO',
                 'POWERTOOLS_SERVICE_NAME': 'cost meter'
             },
+            memory_size=1769,
+            reserved_concurrent_executions=cost_meter_reserved_concurrency,
             timeout=Duration.seconds(60),
             events=[
                 aws_lambda_event_sources.DynamoEventSource(
                     tasks_table,
-                    batch_size=5,
+                    batch_size=100,
                     bisect_batch_on_error=True,
-                    max_batching_window=Duration.seconds(1),
+                    # Bin updates are not idempotent, a failed batch is only retried from its first failed record
+                    report_batch_item_failures=True,
+                    max_batching_window=Duration.seconds(15),
+                    parallelization_factor=10,
                     retry_attempts=10,
+                    # Records still failing after all retries are reported to the queue instead of being dropped
+                    on_failure=aws_lambda_event_sources.SqsDlq(cost_meter_failure_queue),
                     starting_position=aws_lambda.StartingPosition.TRIM_HORIZON,
+                    # Only records which complete a task item, i.e. add the cost or the user identity as the
+                    # last of both attributes, are aggregated
                     filters=[
                         aws_lambda.FilterCriteria.filter({
                             'eventName': aws_lambda.FilterRule.is_equal('MODIFY'),
@@ -266,6 +354,21 @@ class AmazonBraketCostControlStack(Stack):
                                 'NewImage': {
                                     'cost': {'N': aws_lambda.FilterRule.exists()},
                                     'user_identity': {'S': aws_lambda.FilterRule.exists()}
+                                },
+                                'OldImage': {
+                                    'cost': {'N': aws_lambda.FilterRule.not_exists()}
+                                }
+                            }
+                        }),
+                        aws_lambda.FilterCriteria.filter({
+                            'eventName': aws_lambda.FilterRule.is_equal('MODIFY'),
+                            'dynamodb': {
+                                'NewImage': {
+                                    'cost': {'N': aws_lambda.FilterRule.exists()},
+                                    'user_identity': {'S': aws_lambda.FilterRule.exists()}
+                                },
+                                'OldImage': {
+                                    'user_identity': {'S': aws_lambda.FilterRule.not_exists()}
                                 }
                             }
                         })
@@ -294,21 +397,6 @@ class AmazonBraketCostControlStack(Stack):
             ]
         )
         notification_topic.add_subscription(aws_sns_subscriptions.EmailSubscription(notification_email_address))
-        notification_topic.add_to_resource_policy(aws_iam.PolicyStatement(
-            effect=aws_iam.Effect.DENY,
-            principals=[aws_iam.AnyPrincipal()],
-            actions=['sns:Publish'],
-            resources=[notification_topic.topic_arn],
-            conditions={
-                'Bool': {'aws:SecureTransport': False}
-            }
-        ))
-        notification_topic.add_to_resource_policy(aws_iam.PolicyStatement(
-            effect=aws_iam.Effect.ALLOW,
-            principals=[aws_iam.ServicePrincipal('cloudwatch.amazonaws.com')],
-            actions=['sns:Publish'],
-            resources=[notification_topic.topic_arn]
-        ))
 
         cost_control_enforcement_policy = aws_iam.ManagedPolicy(
             self,
@@ -323,6 +411,18 @@ class AmazonBraketCostControlStack(Stack):
             ]
         )
 
+        controlled_identities_parameter = aws_ssm.StringParameter(
+            self,
+            'controlled-identities-parameter',
+            parameter_name='/braket-cost-control/controlled-identities',
+            description='IAM identities the cost control enforcement policy is attached to when a budget alarm is in ALARM state',
+            string_value=json.dumps({
+                'roles': role_names_to_control,
+                'groups': group_names_to_control,
+                'users': user_names_to_control,
+            })
+        )
+
         cost_control_lambda_role = aws_iam.Role(
             self,
             'cost-control-lambda-role',
@@ -348,7 +448,11 @@ class AmazonBraketCostControlStack(Stack):
                     actions=['sns:Publish'],
                     resources=[notification_topic.topic_arn]
                 ),
-
+                aws_iam.PolicyStatement(
+                    effect=aws_iam.Effect.ALLOW,
+                    actions=['ssm:GetParameter'],
+                    resources=[controlled_identities_parameter.parameter_arn]
+                ),
             ])}
         )
         NagSuppressions.add_resource_suppressions(
@@ -358,40 +462,61 @@ class AmazonBraketCostControlStack(Stack):
                 {'id': 'AwsSolutions-IAM5', 'reason': 'Used wildcards required for functionality'},
             ]
         )
-        cost_control_lambda = aws_lambda.DockerImageFunction(
+        cost_control_log_group = aws_logs.LogGroup(
+            self,
+            'cost-control-log-group',
+            retention=aws_logs.RetentionDays.ONE_MONTH
+        )
+        cost_control_lambda = aws_lambda.Function(
             self,
             'cost-control-lambda',
             function_name='braket-cost-control-action',
             role=cost_control_lambda_role,
-            code=aws_lambda.DockerImageCode.from_image_asset(
-                directory=pathlib.Path(__file__)
-                .parent
-                .parent
-                .joinpath('lambda')
-                .joinpath('quantum_task_cost_control')
-                .resolve()
-                .as_posix()
-            ),
+            code=aws_lambda.Code.from_asset(path=_lambda_asset('quantum_task_cost_control')),
+            handler='index.handler',
+            runtime=aws_lambda.Runtime.PYTHON_3_12,
+            layers=[powertools_layer],
             architecture=aws_lambda.Architecture.ARM_64,
-            log_retention=aws_logs.RetentionDays.ONE_MONTH,
-            log_retention_role=log_retention_role,
+            log_group=cost_control_log_group,
             environment={
                 'TOPIC_ARN': notification_topic.topic_arn,
                 'POLICY_ARN': cost_control_enforcement_policy.managed_policy_arn,
-                'ROLES': ','.join(role_names_to_control),
-                'GROUPS': ','.join(group_names_to_control),
-                'USERS': ','.join(user_names_to_control),
+                'CONTROLLED_IDENTITIES_PARAMETER_NAME': controlled_identities_parameter.parameter_name,
                 'LOG_LEVEL': 'DEBUG',
                 'POWERTOOLS_SERVICE_NAME': 'cost control'
             },
+            memory_size=1769,
+            reserved_concurrent_executions=cost_control_reserved_concurrency,
             timeout=Duration.seconds(60)
         )
-        notification_topic.add_to_resource_policy(aws_iam.PolicyStatement(
-            effect=aws_iam.Effect.ALLOW,
-            principals=[aws_iam.ArnPrincipal(cost_control_lambda_role.role_arn)],
-            actions=['sns:Publish'],
-            resources=[notification_topic.topic_arn]
-        ))
+        aws_sns.TopicPolicy(
+            self,
+            'notification-topic-policy',
+            topics=[notification_topic],
+            policy_document=aws_iam.PolicyDocument(statements=[
+                aws_iam.PolicyStatement(
+                    effect=aws_iam.Effect.DENY,
+                    principals=[aws_iam.AnyPrincipal()],
+                    actions=['sns:Publish'],
+                    resources=[notification_topic.topic_arn],
+                    conditions={
+                        'Bool': {'aws:SecureTransport': False}
+                    }
+                ),
+                aws_iam.PolicyStatement(
+                    effect=aws_iam.Effect.ALLOW,
+                    principals=[aws_iam.ServicePrincipal('cloudwatch.amazonaws.com')],
+                    actions=['sns:Publish'],
+                    resources=[notification_topic.topic_arn]
+                ),
+                aws_iam.PolicyStatement(
+                    effect=aws_iam.Effect.ALLOW,
+                    principals=[aws_iam.ArnPrincipal(cost_control_lambda_role.role_arn)],
+                    actions=['sns:Publish'],
+                    resources=[notification_topic.topic_arn]
+                ),
+            ])
+        )
 
         cost_explorer_lambda_role = aws_iam.Role(
             self,
@@ -417,27 +542,28 @@ class AmazonBraketCostControlStack(Stack):
                 {'id': 'AwsSolutions-IAM5', 'reason': 'Used wildcards required for functionality'},
             ]
         )
-        cost_explorer_lambda = aws_lambda.DockerImageFunction(
+        cost_explorer_log_group = aws_logs.LogGroup(
+            self,
+            'cost-explorer-log-group',
+            retention=aws_logs.RetentionDays.ONE_MONTH
+        )
+        cost_explorer_lambda = aws_lambda.Function(
             self,
             'cost-explorer-lambda',
             function_name='braket-cost-explorer-report',
             role=cost_explorer_lambda_role,
-            code=aws_lambda.DockerImageCode.from_image_asset(
-                directory=pathlib.Path(__file__)
-                .parent
-                .parent
-                .joinpath('lambda')
-                .joinpath('cost_explorer_report')
-                .resolve()
-                .as_posix()
-            ),
+            code=aws_lambda.Code.from_asset(path=_lambda_asset('cost_explorer_report')),
+            handler='index.handler',
+            runtime=aws_lambda.Runtime.PYTHON_3_12,
+            layers=[powertools_layer],
             architecture=aws_lambda.Architecture.ARM_64,
-            log_retention=aws_logs.RetentionDays.ONE_MONTH,
-            log_retention_role=log_retention_role,
+            log_group=cost_explorer_log_group,
             environment={
                 'TAG_KEY': tag_key,
                 'SOLUTION_ID': solution_id
             },
+            memory_size=1769,
+            reserved_concurrent_executions=cost_explorer_reserved_concurrency,
             timeout=Duration.seconds(60)
         )
 
@@ -478,26 +604,13 @@ class AmazonBraketCostControlStack(Stack):
             statistic='Maximum',
             unit=aws_cloudwatch.Unit.COUNT
         )
-        task_logger_lambda_metric = task_logger_lambda.metric_errors().with_(
-            color=aws_cloudwatch.Color.RED,
-            period=Duration.minutes(1)
-        )
-        cost_meter_lambda_metric = cost_meter_lambda.metric_errors().with_(
-            color=aws_cloudwatch.Color.RED,
-            period=Duration.minutes(1)
-        )
-        cost_control_lambda_metric = cost_control_lambda.metric_errors().with_(
-            color=aws_cloudwatch.Color.RED,
-            period=Duration.minutes(1)
-        )
-
         task_cost_alarm_all_time = task_cost_all_time_aggregate_metric.create_alarm(
             self,
             'cost-control-alarm-all-time',
             alarm_name='Quantum Task Cost All-Time Aggregate',
             comparison_operator=aws_cloudwatch.ComparisonOperator.GREATER_THAN_OR_EQUAL_TO_THRESHOLD,
             threshold=float(all_time_cost_limit),
-            evaluation_periods=(task_cost_all_time_aggregate_metric.period.to_minutes() * 60 * 24),
+            evaluation_periods=_evaluation_periods(COST_ALARM_EVALUATION_WINDOW, task_cost_all_time_aggregate_metric.period),
             datapoints_to_alarm=1,
             treat_missing_data=aws_cloudwatch.TreatMissingData.IGNORE,
             actions_enabled=True,
@@ -507,50 +620,32 @@ class AmazonBraketCostControlStack(Stack):
             'cost-control-alarm-monthly',
             alarm_name='Quantum Task Cost Monthly Aggregate',
             threshold=float(monthly_cost_limit),
-            evaluation_periods=(task_cost_monthly_aggregate_metric.period.to_minutes() * 60 * 24),
+            evaluation_periods=_evaluation_periods(COST_ALARM_EVALUATION_WINDOW, task_cost_monthly_aggregate_metric.period),
             datapoints_to_alarm=1,
             treat_missing_data=aws_cloudwatch.TreatMissingData.IGNORE,
             actions_enabled=True,
         )
-        task_logger_lambda_alarm = task_logger_lambda_metric.create_alarm(
-            self,
+        task_logger_lambda_alarm = self._lambda_error_alarm(
             'task-logger-lambda-alarm',
-            alarm_name='Lambda Invocation Task Logger',
-            threshold=1,
-            evaluation_periods=(task_logger_lambda_metric.period.to_minutes() * 60),
-            datapoints_to_alarm=1,
-            comparison_operator=aws_cloudwatch.ComparisonOperator.GREATER_THAN_OR_EQUAL_TO_THRESHOLD,
-            treat_missing_data=aws_cloudwatch.TreatMissingData.NOT_BREACHING,
-            actions_enabled=True,
+            lambda_function=task_logger_lambda,
+            alarm_name='Lambda Invocation Task Logger'
         )
-        cost_meter_lambda_alarm = cost_meter_lambda_metric.create_alarm(
-            self,
+        cost_meter_lambda_alarm = self._lambda_error_alarm(
             'cost-meter-lambda-alarm',
-            alarm_name='Lambda Invocation Cost Meter',
-            threshold=1,
-            evaluation_periods=(cost_meter_lambda_metric.period.to_minutes() * 60),
-            datapoints_to_alarm=1,
-            comparison_operator=aws_cloudwatch.ComparisonOperator.GREATER_THAN_OR_EQUAL_TO_THRESHOLD,
-            treat_missing_data=aws_cloudwatch.TreatMissingData.NOT_BREACHING,
-            actions_enabled=True,
+            lambda_function=cost_meter_lambda,
+            alarm_name='Lambda Invocation Cost Meter'
         )
-        cost_control_lambda_alarm = cost_control_lambda_metric.create_alarm(
-            self,
+        cost_control_lambda_alarm = self._lambda_error_alarm(
             'cost-control-lambda-alarm',
-            alarm_name='Lambda Invocation Cost Control Action',
-            threshold=1,
-            evaluation_periods=(cost_control_lambda_metric.period.to_minutes() * 60),
-            datapoints_to_alarm=1,
-            comparison_operator=aws_cloudwatch.ComparisonOperator.GREATER_THAN_OR_EQUAL_TO_THRESHOLD,
-            treat_missing_data=aws_cloudwatch.TreatMissingData.NOT_BREACHING,
-            actions_enabled=True,
+            lambda_function=cost_control_lambda,
+            alarm_name='Lambda Invocation Cost Control Action'
         )
         task_creation_rule_invocation_alarm = aws_cloudwatch.Alarm(
             self,
             'task-creation-rule-invocation-alarm',
             alarm_name='Braket Task Creation Rule Invocation Failures',
             threshold=1,
-            evaluation_periods=60,
+            evaluation_periods=_evaluation_periods(OPERATIONAL_ALARM_EVALUATION_WINDOW, Duration.minutes(1)),
             datapoints_to_alarm=1,
             comparison_operator=aws_cloudwatch.ComparisonOperator.GREATER_THAN_OR_EQUAL_TO_THRESHOLD,
             treat_missing_data=aws_cloudwatch.TreatMissingData.NOT_BREACHING,
@@ -569,7 +664,7 @@ class AmazonBraketCostControlStack(Stack):
             'task-state-change-rule-invocation-alarm',
             alarm_name='Braket Task State Change Rule Invocation Failures',
             threshold=1,
-            evaluation_periods=60,
+            evaluation_periods=_evaluation_periods(OPERATIONAL_ALARM_EVALUATION_WINDOW, Duration.minutes(1)),
             datapoints_to_alarm=1,
             comparison_operator=aws_cloudwatch.ComparisonOperator.GREATER_THAN_OR_EQUAL_TO_THRESHOLD,
             treat_missing_data=aws_cloudwatch.TreatMissingData.NOT_BREACHING,
@@ -583,402 +678,331 @@ class AmazonBraketCostControlStack(Stack):
                 unit=aws_cloudwatch.Unit.COUNT
             )
         )
+        cost_meter_failure_queue_alarm = cost_meter_failure_queue.metric_approximate_number_of_messages_visible(
+            period=Duration.minutes(1),
+            statistic='Maximum'
+        ).create_alarm(
+            self,
+            'cost-meter-failure-queue-alarm',
+            alarm_name='Cost Meter Failed Records',
+            threshold=1,
+            evaluation_periods=_evaluation_periods(OPERATIONAL_ALARM_EVALUATION_WINDOW, Duration.minutes(1)),
+            datapoints_to_alarm=1,
+            comparison_operator=aws_cloudwatch.ComparisonOperator.GREATER_THAN_OR_EQUAL_TO_THRESHOLD,
+            treat_missing_data=aws_cloudwatch.TreatMissingData.NOT_BREACHING,
+            actions_enabled=True,
+        )
+
+        operational_alarm = aws_cloudwatch.CompositeAlarm(
+            self,
+            'operational-composite-alarm',
+            composite_alarm_name='Braket Cost Control Operational Alarms',
+            alarm_rule=aws_cloudwatch.AlarmRule.any_of(*[
+                aws_cloudwatch.AlarmRule.from_alarm(alarm, aws_cloudwatch.AlarmState.ALARM) for alarm in [
+                    task_logger_lambda_alarm,
+                    cost_meter_lambda_alarm,
+                    cost_control_lambda_alarm,
+                    task_creation_rule_invocation_alarm,
+                    task_state_change_rule_invocation_alarm,
+                    cost_meter_failure_queue_alarm,
+                ]
+            ]),
+            actions_enabled=True,
+        )
 
         task_cost_alarm_all_time.add_alarm_action(aws_cloudwatch_actions.SnsAction(notification_topic))
         task_cost_alarm_monthly.add_alarm_action(aws_cloudwatch_actions.SnsAction(notification_topic))
-        task_logger_lambda_alarm.add_alarm_action(aws_cloudwatch_actions.SnsAction(notification_topic))
-        cost_meter_lambda_alarm.add_alarm_action(aws_cloudwatch_actions.SnsAction(notification_topic))
-        cost_control_lambda_alarm.add_alarm_action(aws_cloudwatch_actions.SnsAction(notification_topic))
-        task_creation_rule_invocation_alarm.add_alarm_action(aws_cloudwatch_actions.SnsAction(notification_topic))
-        task_state_change_rule_invocation_alarm.add_alarm_action(aws_cloudwatch_actions.SnsAction(notification_topic))
+        operational_alarm.add_alarm_action(aws_cloudwatch_actions.SnsAction(notification_topic))
 
-        dashboard = aws_cloudwatch.Dashboard(
+        lambda_error_alarms = [
+            (task_logger_lambda, task_logger_lambda_alarm),
+            (cost_meter_lambda, cost_meter_lambda_alarm),
+            (cost_control_lambda, cost_control_lambda_alarm),
+        ]
+        aws_cloudwatch.Dashboard(
             self,
             'cost-control-dashboard',
             dashboard_name='AmazonBraketCostControl',
             period_override=aws_cloudwatch.PeriodOverride.AUTO,
             start='-P1W',
-
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.TextWidget(
-                markdown=f"""
-# Amazon Braket Cost Dashboard
-This Amazon CloudWatch dashboard is created as part of the open-source cost control solution for Amazon Braket and provides a single view for your 
-estimated resource costs related to your usage of Amazon Braket in this AWS account. Keep in mind that cost data displayed here are estimates and that
-the AWS Billing Console provides access to a suite of features helping you set up your billing, retrieve and pay invoices, and analyze, organize, 
-plan, and optimize your costs.
-
-[button:Blog Post](https://aws.amazon.com/blogs/quantum-computing/introducing-a-cost-control-solution-for-amazon-braket/) 
-[button:GitHub Repository](https://github.com/aws-samples/cost-control-for-amazon-braket)
-[button:primary:AWS AWS Billing Console](https://us-east-1.console.aws.amazon.com/costmanagement)
-
-``
-
-## AWS Cost Explorer Data
-Widgets in this section display data retrieved from the AWS Cost Explorer API. You need to enable AWS Cost Explorer in your account before you can 
-use it. See the [AWS Cost Explorer documentation](https://docs.aws.amazon.com/cost-management/latest/userguide/ce-what-is.html) to learn about the
-process of enabling Cost Explorer and about the refresh rate of your cost data.
-                """,
-                width=24,
-                height=6,
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.CustomWidget(
-                title='AWS Cost Explorer Data Month-to-Date',
-                function_arn=cost_explorer_lambda.function_arn,
-                width=24,
-                height=11
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.TextWidget(
-                markdown="""
+            widgets=[
+                [
+                    aws_cloudwatch.TextWidget(
+                        markdown=pathlib.Path(__file__).parent.joinpath('dashboard.md').read_text(),
+                        width=24,
+                        height=6,
+                    )
+                ],
+                [
+                    aws_cloudwatch.CustomWidget(
+                        title='AWS Cost Explorer Data Month-to-Date',
+                        function_arn=cost_explorer_lambda.function_arn,
+                        width=24,
+                        height=11
+                    )
+                ],
+                [
+                    aws_cloudwatch.TextWidget(
+                        markdown="""
 ## Near Real-Time Quantum Task Cost Estimation
 Near real-time cost estimates of on-demand simulator and quantum processing unit tasks - created either individually or in the context of an Amazon Braket Hybrid Job 
 execution - recorded by the open-source cost control solution for Amazon Braket.
-                """,
-                width=24,
-                height=2,
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.AlarmStatusWidget(
-                title='Budget Alarm Status',
-                alarms=[
-                    task_cost_alarm_all_time,
-                    task_cost_alarm_monthly,
-                ],
-                width=24,
-                height=2,
-            ),
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.GaugeWidget(
-                live_data=True,
-                title='Quantum Task Cost All-Time Aggregate [$]',
-                metrics=[task_cost_all_time_aggregate_metric],
-                left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=float(all_time_cost_limit), label='$', show_units=True),
-                legend_position=aws_cloudwatch.LegendPosition.HIDDEN,
-                set_period_to_time_range=False,
-                width=6,
-                height=6,
-            ),
-            aws_cloudwatch.AlarmWidget(
-                alarm=task_cost_alarm_all_time,
-                title='Quantum Task Cost All-Time Aggregate',
-                width=18,
-                height=6,
-                left_y_axis=aws_cloudwatch.YAxisProps(min=0, label='$', show_units=True),
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.GaugeWidget(
-                live_data=True,
-                title='Quantum Task Cost Monthly Aggregate [$]',
-                metrics=[task_cost_monthly_aggregate_metric],
-                left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=float(monthly_cost_limit), label='$', show_units=True),
-                legend_position=aws_cloudwatch.LegendPosition.HIDDEN,
-                set_period_to_time_range=False,
-                width=6,
-                height=6,
-            ),
-            aws_cloudwatch.AlarmWidget(
-                alarm=task_cost_alarm_monthly,
-                title='Quantum Task Cost Monthly Aggregate',
-                width=18,
-                height=6,
-                left_y_axis=aws_cloudwatch.YAxisProps(min=0, label='$', show_units=True),
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.GraphWidget(
-                live_data=True,
-                title='Quantum Task Cost Per Day',
-                left=[task_cost_metric],
-                left_y_axis=aws_cloudwatch.YAxisProps(min=0, label='$', show_units=True),
-                set_period_to_time_range=True,
-                width=8,
-                height=6,
-                view=aws_cloudwatch.GraphWidgetView.TIME_SERIES,
-                stacked=True,
-                legend_position=aws_cloudwatch.LegendPosition.HIDDEN,
-            ),
-            aws_cloudwatch.GraphWidget(
-                live_data=True,
-                title='Monthly Aggregate Of Recently Active Users [$]',
-                left=[aws_cloudwatch.MathExpression(
-                    label='TotalTaskCost',
-                    expression='SELECT MAX(AggregatedQuantumTaskCostMonth) FROM SCHEMA(\"/aws/braket\", \"User Identity\") GROUP BY \"User Identity\"'
-                )],
-                set_period_to_time_range=True,
-                width=8,
-                height=6,
-                view=aws_cloudwatch.GraphWidgetView.PIE
-            ),
-            aws_cloudwatch.GraphWidget(
-                live_data=True,
-                title='Monthly Aggregate Of Recently Used Devices [$]',
-                left=[aws_cloudwatch.MathExpression(
-                    label='TotalTaskCost',
-                    expression='SELECT MAX(AggregatedQuantumTaskCostMonth) FROM SCHEMA(\"/aws/braket\", \"Device\") GROUP BY \"Device\"'
-                )],
-                set_period_to_time_range=True,
-                width=8,
-                height=6,
-                view=aws_cloudwatch.GraphWidgetView.PIE
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.TextWidget(
-                markdown="""
-## Operational Metrics
-Metrics in this section help you monitor the open-source cost control solution is up and running, and operating as expected.
-                """,
-                width=24,
-                height=2,
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.AlarmStatusWidget(
-                title='Operational Alarm Status',
-                alarms=[
-                    task_logger_lambda_alarm,
-                    cost_meter_lambda_alarm,
-                    cost_control_lambda_alarm,
-                    task_state_change_rule_invocation_alarm,
-                    task_creation_rule_invocation_alarm
-                ],
-                width=24,
-                height=2,
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.AlarmWidget(
-                title='{} Lambda Invocation Errors'.format(task_logger_lambda.function_name),
-                left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=1.5, show_units=True),
-                alarm=task_logger_lambda_alarm,
-                width=8,
-                height=4
-            ),
-            aws_cloudwatch.AlarmWidget(
-                title='{} Lambda Invocation Errors'.format(cost_meter_lambda.function_name),
-                left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=1.5, show_units=True),
-                alarm=cost_meter_lambda_alarm,
-                width=8,
-                height=4
-            ),
-            aws_cloudwatch.AlarmWidget(
-                title='{} Lambda Invocation Errors'.format(cost_control_lambda.function_name),
-                left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=1.5, show_units=True),
-                alarm=cost_control_lambda_alarm,
-                width=8,
-                height=4
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.GraphWidget(
-                title='Average Event Ingestion-To-Invocation Latency',
-                left=[
-                    aws_cloudwatch.Metric(
-                        namespace='AWS/Events',
-                        metric_name='IngestionToInvocationStartLatency',
-                        period=Duration.hours(1),
-                        statistic='Average',
-                        unit=aws_cloudwatch.Unit.COUNT
+                        """,
+                        width=24,
+                        height=2,
                     )
                 ],
-                live_data=True,
-                view=aws_cloudwatch.GraphWidgetView.TIME_SERIES,
-                width=8,
-                height=4
-            ),
-            aws_cloudwatch.AlarmWidget(
-                title='Task Creation Event Rule Failed Invocations',
-                left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=1.5, label='Count', show_units=True),
-                alarm=task_creation_rule_invocation_alarm,
-                width=8,
-                height=4
-            ),
-            aws_cloudwatch.AlarmWidget(
-                title='Task State Change Event Rule Failed Invocations',
-                left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=1.5, label='Count', show_units=True),
-                alarm=task_state_change_rule_invocation_alarm,
-                width=8,
-                height=4
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.GraphWidget(
-                title='{} Consumed Read/Write Capacity Units'.format(tasks_table.table_name),
-                left=[
-                    aws_cloudwatch.Metric(
-                        namespace='AWS/DynamoDB',
-                        metric_name='ConsumedReadCapacityUnits',
-                        dimensions_map={'TableName': tasks_table.table_name},
-                        period=Duration.days(1),
-                        statistic='Sum',
-                        unit=aws_cloudwatch.Unit.COUNT
+                [
+                    aws_cloudwatch.AlarmStatusWidget(
+                        title='Budget Alarm Status',
+                        alarms=[
+                            task_cost_alarm_all_time,
+                            task_cost_alarm_monthly,
+                        ],
+                        width=24,
+                        height=2,
                     ),
-                    aws_cloudwatch.Metric(
-                        namespace='AWS/DynamoDB',
-                        metric_name='ConsumedWriteCapacityUnits',
-                        dimensions_map={'TableName': tasks_table.table_name},
-                        period=Duration.days(1),
-                        statistic='Sum',
-                        unit=aws_cloudwatch.Unit.COUNT
+                ],
+                [
+                    aws_cloudwatch.GaugeWidget(
+                        live_data=True,
+                        title='Quantum Task Cost All-Time Aggregate [$]',
+                        metrics=[task_cost_all_time_aggregate_metric],
+                        left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=float(all_time_cost_limit), label='$', show_units=True),
+                        legend_position=aws_cloudwatch.LegendPosition.HIDDEN,
+                        set_period_to_time_range=False,
+                        width=6,
+                        height=6,
+                    ),
+                    aws_cloudwatch.AlarmWidget(
+                        alarm=task_cost_alarm_all_time,
+                        title='Quantum Task Cost All-Time Aggregate',
+                        width=18,
+                        height=6,
+                        left_y_axis=aws_cloudwatch.YAxisProps(min=0, label='$', show_units=True),
                     )
                 ],
-                live_data=True,
-                width=8,
-                height=4,
-                view=aws_cloudwatch.GraphWidgetView.TIME_SERIES
-            ),
-            aws_cloudwatch.GraphWidget(
-                title='{} Consumed Read/Write Capacity Units'.format(cost_table.table_name),
-                left=[
-                    aws_cloudwatch.Metric(
-                        namespace='AWS/DynamoDB',
-                        metric_name='ConsumedReadCapacityUnits',
-                        dimensions_map={'TableName': cost_table.table_name},
-                        period=Duration.days(1),
-                        statistic='Sum',
-                        unit=aws_cloudwatch.Unit.COUNT
+                [
+                    aws_cloudwatch.GaugeWidget(
+                        live_data=True,
+                        title='Quantum Task Cost Monthly Aggregate [$]',
+                        metrics=[task_cost_monthly_aggregate_metric],
+                        left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=float(monthly_cost_limit), label='$', show_units=True),
+                        legend_position=aws_cloudwatch.LegendPosition.HIDDEN,
+                        set_period_to_time_range=False,
+                        width=6,
+                        height=6,
                     ),
-                    aws_cloudwatch.Metric(
-                        namespace='AWS/DynamoDB',
-                        metric_name='ConsumedWriteCapacityUnits',
-                        dimensions_map={'TableName': cost_table.table_name},
-                        period=Duration.days(1),
-                        statistic='Sum',
-                        unit=aws_cloudwatch.Unit.COUNT
+                    aws_cloudwatch.AlarmWidget(
+                        alarm=task_cost_alarm_monthly,
+                        title='Quantum Task Cost Monthly Aggregate',
+                        width=18,
+                        height=6,
+                        left_y_axis=aws_cloudwatch.YAxisProps(min=0, label='$', show_units=True),
                     )
                 ],
-                live_data=True,
-                width=8,
-                height=4,
-                view=aws_cloudwatch.GraphWidgetView.TIME_SERIES
-            ),
-            aws_cloudwatch.GraphWidget(
-                title='SNS Email Notifications',
-                left=[
-                    aws_cloudwatch.Metric(
-                        namespace='AWS/SNS',
-                        metric_name='NumberOfNotificationsDelivered',
-                        dimensions_map={'TopicName': notification_topic.topic_name},
-                        period=Duration.hours(1),
-                        statistic='Sum',
-                        unit=aws_cloudwatch.Unit.COUNT
+                [
+                    aws_cloudwatch.GraphWidget(
+                        live_data=False,
+                        title='Quantum Task Cost Per Day',
+                        left=[task_cost_metric],
+                        left_y_axis=aws_cloudwatch.YAxisProps(min=0, label='$', show_units=True),
+                        set_period_to_time_range=True,
+                        width=8,
+                        height=6,
+                        view=aws_cloudwatch.GraphWidgetView.TIME_SERIES,
+                        stacked=True,
+                        legend_position=aws_cloudwatch.LegendPosition.HIDDEN,
                     ),
-                    aws_cloudwatch.Metric(
-                        namespace='AWS/SNS',
-                        metric_name='NumberOfNotificationsFailed',
-                        dimensions_map={'TopicName': notification_topic.topic_name},
-                        period=Duration.hours(1),
-                        statistic='Sum',
-                        unit=aws_cloudwatch.Unit.COUNT
+                    aws_cloudwatch.GraphWidget(
+                        live_data=False,
+                        title='Monthly Aggregate Of Recently Active Users [$]',
+                        left=[aws_cloudwatch.MathExpression(
+                            label='TotalTaskCost',
+                            expression='SELECT MAX(AggregatedQuantumTaskCostMonth) FROM SCHEMA(\"/aws/braket\", \"User Identity\") GROUP BY \"User Identity\" ORDER BY MAX() DESC LIMIT 20',
+                            period=Duration.days(1)
+                        )],
+                        width=8,
+                        height=6,
+                        view=aws_cloudwatch.GraphWidgetView.PIE
                     ),
+                    aws_cloudwatch.GraphWidget(
+                        live_data=False,
+                        title='Monthly Aggregate Of Recently Used Devices [$]',
+                        left=[aws_cloudwatch.MathExpression(
+                            label='TotalTaskCost',
+                            expression='SELECT MAX(AggregatedQuantumTaskCostMonth) FROM SCHEMA(\"/aws/braket\", \"Device\") GROUP BY \"Device\" ORDER BY MAX() DESC LIMIT 20',
+                            period=Duration.days(1)
+                        )],
+                        width=8,
+                        height=6,
+                        view=aws_cloudwatch.GraphWidgetView.PIE
+                    )
                 ],
-                live_data=True,
-                width=8,
-                height=4,
-                view=aws_cloudwatch.GraphWidgetView.TIME_SERIES
-            ),
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.LogQueryWidget(
-                title='{} Memory Consumption [MB]'.format(task_logger_lambda.function_name),
-                log_group_names=[task_logger_lambda.log_group.log_group_name],
-                query_lines=[
-                    'fields @message',
-                    'filter @type = "REPORT"',
-                    'stats '
-                    'max(@maxMemoryUsed / 1024 / 1024) as max,'
-                    'avg(@maxMemoryUsed / 1024 / 1024) as avg,'
-                    'min(@maxMemoryUsed / 1024 / 1024) as min'
+                [
+                    aws_cloudwatch.TextWidget(
+                        markdown="""
+## Operational Metrics
+Metrics in this section help you monitor the open-source cost control solution is up and running, and operating as expected.
+                        """,
+                        width=24,
+                        height=2,
+                    )
                 ],
-                view=aws_cloudwatch.LogQueryVisualizationType.TABLE,
-                width=8,
-                height=3,
-            ),
-            aws_cloudwatch.LogQueryWidget(
-                title='{} Memory Consumption [MB]'.format(cost_meter_lambda.function_name),
-                log_group_names=[cost_meter_lambda.log_group.log_group_name],
-                query_lines=[
-                    'fields @message',
-                    'filter @type = "REPORT"',
-                    'stats '
-                    'max(@maxMemoryUsed / 1024 / 1024) as max,'
-                    'avg(@maxMemoryUsed / 1024 / 1024) as avg,'
-                    'min(@maxMemoryUsed / 1024 / 1024) as min'
+                [
+                    aws_cloudwatch.AlarmStatusWidget(
+                        title='Operational Alarm Status',
+                        alarms=[
+                            operational_alarm,
+                            task_logger_lambda_alarm,
+                            cost_meter_lambda_alarm,
+                            cost_control_lambda_alarm,
+                            task_state_change_rule_invocation_alarm,
+                            task_creation_rule_invocation_alarm,
+                            cost_meter_failure_queue_alarm
+                        ],
+                        width=24,
+                        height=2,
+                    )
                 ],
-                view=aws_cloudwatch.LogQueryVisualizationType.TABLE,
-                width=8,
-                height=3,
-            ),
-            aws_cloudwatch.LogQueryWidget(
-                title='{} Memory Consumption [MB]'.format(cost_control_lambda.function_name),
-                log_group_names=[cost_control_lambda.log_group.log_group_name],
-                query_lines=[
-                    'fields @message',
-                    'filter @type = "REPORT"',
-                    'stats '
-                    'max(@maxMemoryUsed / 1024 / 1024) as max,'
-                    'avg(@maxMemoryUsed / 1024 / 1024) as avg,'
-                    'min(@maxMemoryUsed / 1024 / 1024) as min'
+                [
+                    _lambda_errors_widget(lambda_function, alarm)
+                    for lambda_function, alarm in lambda_error_alarms
                 ],
-                view=aws_cloudwatch.LogQueryVisualizationType.TABLE,
-                width=8,
-                height=3,
-            )
-        )
-        dashboard.add_widgets(
-            aws_cloudwatch.LogQueryWidget(
-                title='{} Execution Duration [s]'.format(task_logger_lambda.function_name),
-                log_group_names=[task_logger_lambda.log_group.log_group_name],
-                query_lines=[
-                    'fields @message',
-                    'filter @type = "REPORT"',
-                    'stats '
-                    'max(@billedDuration / 1000) as max,'
-                    'avg(@billedDuration / 1000) as avg,'
-                    'min(@billedDuration / 1000) as min'
+                [
+                    aws_cloudwatch.GraphWidget(
+                        title='Average Event Ingestion-To-Invocation Latency',
+                        left=[
+                            aws_cloudwatch.Metric(
+                                namespace='AWS/Events',
+                                metric_name='IngestionToInvocationStartLatency',
+                                period=Duration.hours(1),
+                                statistic='Average',
+                                unit=aws_cloudwatch.Unit.COUNT
+                            )
+                        ],
+                        live_data=True,
+                        view=aws_cloudwatch.GraphWidgetView.TIME_SERIES,
+                        width=8,
+                        height=4
+                    ),
+                    aws_cloudwatch.AlarmWidget(
+                        title='Task Creation Event Rule Failed Invocations',
+                        left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=1.5, label='Count', show_units=True),
+                        alarm=task_creation_rule_invocation_alarm,
+                        width=8,
+                        height=4
+                    ),
+                    aws_cloudwatch.AlarmWidget(
+                        title='Task State Change Event Rule Failed Invocations',
+                        left_y_axis=aws_cloudwatch.YAxisProps(min=0, max=1.5, label='Count', show_units=True),
+                        alarm=task_state_change_rule_invocation_alarm,
+                        width=8,
+                        height=4
+                    )
                 ],
-                view=aws_cloudwatch.LogQueryVisualizationType.TABLE,
-                width=8,
-                height=3,
-            ),
-            aws_cloudwatch.LogQueryWidget(
-                title='{} Execution Duration [s]'.format(cost_meter_lambda.function_name),
-                log_group_names=[cost_meter_lambda.log_group.log_group_name],
-                query_lines=[
-                    'fields @message',
-                    'filter @type = "REPORT"',
-                    'stats '
-                    'max(@billedDuration / 1000) as max,'
-                    'avg(@billedDuration / 1000) as avg,'
-                    'min(@billedDuration / 1000) as min'
+                [
+                    aws_cloudwatch.GraphWidget(
+                        title='{} Consumed Read+Write Capacity Units'.format(tasks_table.table_name),
+                        left=[
+                            aws_cloudwatch.MathExpression(
+                                label='ConsumedCapacityUnits',
+                                expression='FILL(read, 0) + FILL(write, 0)',
+                                using_metrics={
+                                    'read': aws_cloudwatch.Metric(
+                                        namespace='AWS/DynamoDB',
+                                        metric_name='ConsumedReadCapacityUnits',
+                                        dimensions_map={'TableName': tasks_table.table_name},
+                                        statistic='Sum',
+                                        unit=aws_cloudwatch.Unit.COUNT
+                                    ),
+                                    'write': aws_cloudwatch.Metric(
+                                        namespace='AWS/DynamoDB',
+                                        metric_name='ConsumedWriteCapacityUnits',
+                                        dimensions_map={'TableName': tasks_table.table_name},
+                                        statistic='Sum',
+                                        unit=aws_cloudwatch.Unit.COUNT
+                                    )
+                                },
+                                period=Duration.days(1)
+                            )
+                        ],
+                        live_data=False,
+                        width=8,
+                        height=4,
+                        view=aws_cloudwatch.GraphWidgetView.TIME_SERIES
+                    ),
+                    aws_cloudwatch.GraphWidget(
+                        title='{} Consumed Read+Write Capacity Units'.format(cost_table.table_name),
+                        left=[
+                            aws_cloudwatch.MathExpression(
+                                label='ConsumedCapacityUnits',
+                                expression='FILL(read, 0) + FILL(write, 0)',
+                                using_metrics={
+                                    'read': aws_cloudwatch.Metric(
+                                        namespace='AWS/DynamoDB',
+                                        metric_name='ConsumedReadCapacityUnits',
+                                        dimensions_map={'TableName': cost_table.table_name},
+                                        statistic='Sum',
+                                        unit=aws_cloudwatch.Unit.COUNT
+                                    ),
+                                    'write': aws_cloudwatch.Metric(
+                                        namespace='AWS/DynamoDB',
+                                        metric_name='ConsumedWriteCapacityUnits',
+                                        dimensions_map={'TableName': cost_table.table_name},
+                                        statistic='Sum',
+                                        unit=aws_cloudwatch.Unit.COUNT
+                                    )
+                                },
+                                period=Duration.days(1)
+                            )
+                        ],
+                        live_data=False,
+                        width=8,
+                        height=4,
+                        view=aws_cloudwatch.GraphWidgetView.TIME_SERIES
+                    ),
+                    aws_cloudwatch.GraphWidget(
+                        title='SNS Email Notifications',
+                        left=[
+                            aws_cloudwatch.Metric(
+                                namespace='AWS/SNS',
+                                metric_name='NumberOfNotificationsDelivered',
+                                dimensions_map={'TopicName': notification_topic.topic_name},
+                                period=Duration.hours(1),
+                                statistic='Sum',
+                                unit=aws_cloudwatch.Unit.COUNT
+                            ),
+                            aws_cloudwatch.Metric(
+                                namespace='AWS/SNS',
+                                metric_name='NumberOfNotificationsFailed',
+                                dimensions_map={'TopicName': notification_topic.topic_name},
+                                period=Duration.hours(1),
+                                statistic='Sum',
+                                unit=aws_cloudwatch.Unit.COUNT
+                            ),
+                        ],
+                        live_data=True,
+                        width=8,
+                        height=4,
+                        view=aws_cloudwatch.GraphWidgetView.TIME_SERIES
+                    ),
                 ],
-                view=aws_cloudwatch.LogQueryVisualizationType.TABLE,
-                width=8,
-                height=3,
-            ),
-            aws_cloudwatch.LogQueryWidget(
-                title='{} Execution Duration [s]'.format(cost_control_lambda.function_name),
-                log_group_names=[cost_control_lambda.log_group.log_group_name],
-                query_lines=[
-                    'fields @message',
-                    'filter @type = "REPORT"',
-                    'stats '
-                    'max(@billedDuration / 1000) as max,'
-                    'avg(@billedDuration / 1000) as avg,'
-                    'min(@billedDuration / 1000) as min'
+                [
+                    _lambda_report_widget(
+                        'Lambda Memory Consumption [MB]',
+                        [lambda_function for lambda_function, _ in lambda_error_alarms],
+                        '@maxMemoryUsed / 1024 / 1024'
+                    )
                 ],
-                view=aws_cloudwatch.LogQueryVisualizationType.TABLE,
-                width=8,
-                height=3,
-            )
+                [
+                    _lambda_report_widget(
+                        'Lambda Execution Duration [s]',
+                        [lambda_function for lambda_function, _ in lambda_error_alarms],
+                        '@billedDuration / 1000'
+                    )
+                ],
+            ]
         )
 
         alarm_state_change_rule = aws_events.Rule(
@@ -996,3 +1020,20 @@ Metrics in this section help you monitor the open-source cost control solution i
             rule_name='braket-cost-control-alarm-state-change',
         )
         alarm_state_change_rule.add_target(aws_events_targets.LambdaFunction(cost_control_lambda))
+
+    def _lambda_error_alarm(self, construct_id: str, lambda_function: aws_lambda.IFunction, alarm_name: str) -> aws_cloudwatch.Alarm:
+        metric = lambda_function.metric_errors().with_(
+            color=aws_cloudwatch.Color.RED,
+            period=Duration.minutes(1)
+        )
+        return metric.create_alarm(
+            self,
+            construct_id,
+            alarm_name=alarm_name,
+            threshold=1,
+            evaluation_periods=_evaluation_periods(OPERATIONAL_ALARM_EVALUATION_WINDOW, metric.period),
+            datapoints_to_alarm=1,
+            comparison_operator=aws_cloudwatch.ComparisonOperator.GREATER_THAN_OR_EQUAL_TO_THRESHOLD,
+            treat_missing_data=aws_cloudwatch.TreatMissingData.NOT_BREACHING,
+            actions_enabled=True,
+        )
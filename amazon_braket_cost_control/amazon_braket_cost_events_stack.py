@@ -43,7 +43,8 @@ class AmazonBraketCostEventsStack(Stack):
                 detail_type=['AWS API Call via CloudTrail'],
                 detail={
                     'eventSource': ['braket.amazonaws.com'],
-                    'eventName': ['CreateQuantumTask']
+                    'eventName': ['CreateQuantumTask'],
+                    'errorCode': [{"exists": False}]
                 }
             ),
             enabled=True,
@@ -0,0 +1,26 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import os
+import pathlib
+from aws_cdk import App, Aspects, Tags
+from cdk_nag import AwsSolutionsChecks
+
+TAG_KEY = 'solution'
+_VERSION_FILE = pathlib.Path(__file__).parent.parent.joinpath('_version.py')
+
+
+def get_solution_id(app: App) -> str:
+    version = _VERSION_FILE.read_text().splitlines()[-1].split()[-1].strip("\"'")
+    return '{}/{}'.format(app.node.try_get_context('solutionIdentifier'), version)
+
+
+def apply_solution_aspects(app: App, solution_id: str, tag_key: str = TAG_KEY) -> None:
+    """Tag all resources of the app with the solution identifier and add the cdk-nag checks.
+
+    Applied by every app entry point so that resources carry the same cost allocation tag however they are deployed.
+    Set the environment variable CDK_NAG to 0 to skip the checks.
+    """
+    if os.environ.get('CDK_NAG', '1') != '0':
+        Aspects.of(app).add(AwsSolutionsChecks())
+    Tags.of(app).add(tag_key, solution_id)
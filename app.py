@@ -2,30 +2,40 @@
 # SPDX-License-Identifier: MIT-0
 
 import aws_cdk as cdk
-from cdk_nag import AwsSolutionsChecks
 
-from amazon_braket_cost_control.amazon_braket_cost_bus_stack import AmazonBraketCostBusStack
+from amazon_braket_cost_control.amazon_braket_cost_bus_stack import AmazonBraketCostBusStack, DEFAULT_EVENT_BUS_NAME
 from amazon_braket_cost_control.amazon_braket_cost_events_stack import AmazonBraketCostEventsStack
 from amazon_braket_cost_control.amazon_braket_cost_control_stack import AmazonBraketCostControlStack
-
-with open("_version.py") as f:
-    version = f.readlines()[-1].split()[-1].strip("\"'")
+from amazon_braket_cost_control.solution import TAG_KEY, apply_solution_aspects, get_solution_id
 
 app = cdk.App()
 
-tag_key = 'solution'
-solution_id = '{}/{}'.format(app.node.try_get_context('solutionIdentifier'), version)
-aws_account_id = app.node.try_get_context('awsAccountId')
-primary_region = app.node.try_get_context('primaryRegion')
-braket_regions = app.node.try_get_context('braketRegions')
-task_item_ttl_days = app.node.try_get_context('taskItemTTLDays')
-notification_email_address = app.node.try_get_context('notificationEmailAddress')
-all_time_cost_limit = app.node.try_get_context('allTimeCostLimit')
-monthly_cost_limit = app.node.try_get_context('monthlyCostLimit')
-iam_role_names_to_control = app.node.try_get_context('iamRoleNamesToControl')
-iam_group_names_to_control = app.node.try_get_context('iamGroupNamesToControl')
-iam_user_names_to_control = app.node.try_get_context('iamUserNamesToControl')
-event_bus_name = 'braket-cost-control-bus'
+tag_key = TAG_KEY
+context = {
+    key: app.node.try_get_context(key) for key in (
+        'solutionIdentifier',
+        'awsAccountId',
+        'primaryRegion',
+        'braketRegions',
+        'taskItemTTLDays',
+        'notificationEmailAddress',
+        'allTimeCostLimit',
+        'monthlyCostLimit',
+        'iamRoleNamesToControl',
+        'iamGroupNamesToControl',
+        'iamUserNamesToControl',
+        'taskLoggerReservedConcurrency',
+        'costMeterReservedConcurrency',
+        'costControlReservedConcurrency',
+        'costExplorerReservedConcurrency',
+        'taskResultBucketNames',
+    )
+}
+solution_id = get_solution_id(app)
+aws_account_id = context['awsAccountId']
+primary_region = context['primaryRegion']
+braket_regions = context['braketRegions']
+event_bus_name = DEFAULT_EVENT_BUS_NAME
 
 AmazonBraketCostBusStack(
     app,
@@ -49,16 +59,20 @@ AmazonBraketCostControlStack(
     'AmazonBraketCostControlStack',
     env=cdk.Environment(account=aws_account_id, region=primary_region),
     event_bus_name=event_bus_name,
-    task_item_ttl_days=task_item_ttl_days,
-    notification_email_address=notification_email_address,
-    all_time_cost_limit=all_time_cost_limit,
-    monthly_cost_limit=monthly_cost_limit,
-    role_names_to_control=iam_role_names_to_control,
-    group_names_to_control=iam_group_names_to_control,
-    user_names_to_control=iam_user_names_to_control,
+    task_item_ttl_days=context['taskItemTTLDays'],
+    notification_email_address=context['notificationEmailAddress'],
+    all_time_cost_limit=context['allTimeCostLimit'],
+    monthly_cost_limit=context['monthlyCostLimit'],
+    role_names_to_control=context['iamRoleNamesToControl'],
+    group_names_to_control=context['iamGroupNamesToControl'],
+    user_names_to_control=context['iamUserNamesToControl'],
+    task_logger_reserved_concurrency=context['taskLoggerReservedConcurrency'],
+    cost_meter_reserved_concurrency=context['costMeterReservedConcurrency'],
+    cost_control_reserved_concurrency=context['costControlReservedConcurrency'],
+    cost_explorer_reserved_concurrency=context['costExplorerReservedConcurrency'],
+    task_result_bucket_names=context['taskResultBucketNames'],
     solution_id=solution_id,
     tag_key=tag_key
 )
-cdk.Aspects.of(app).add(AwsSolutionsChecks())
-cdk.Tags.of(app).add(tag_key, solution_id)
+apply_solution_aspects(app, solution_id=solution_id, tag_key=tag_key)
 app.synth()
@@ -2,15 +2,20 @@
 # SPDX-License-Identifier: MIT-0
 
 import json
-import os
+import subprocess
+import sys
 
-context_file = open('cdk.json')
-context_data = json.load(context_file)
+with open('cdk.json') as context_file:
+    context_data = json.load(context_file)
 account_id = context_data['context']['awsAccountId']
 braket_regions = context_data['context']['braketRegions']
 
+# Bootstrapping waits on CloudFormation, the regions are bootstrapped concurrently
+processes = []
 for region in braket_regions:
     print(f'Bootstrapping your AWS environment: account {account_id}, region {region}')
-    os.system(f'cdk bootstrap aws://{account_id}/{region}')
+    processes.append(subprocess.Popen(['cdk', 'bootstrap', f'aws://{account_id}/{region}']))
 
-context_file.close()
+failed_regions = [region for region, process in zip(braket_regions, processes) if process.wait() != 0]
+if failed_regions:
+    sys.exit(f'Bootstrapping failed for regions: {", ".join(failed_regions)}')
@@ -1,6 +1,8 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: MIT-0
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from braket.circuits import Circuit
 from braket.aws import AwsDevice
 from braket.devices import Devices
@@ -15,8 +17,15 @@ device_arns = [
     Devices.OQC.Lucy,
 ]
 
-for device_arn in device_arns:
-    device = AwsDevice(arn=device_arn)
+
+@functools.lru_cache(maxsize=None)
+def get_device(arn: str) -> AwsDevice:
+    # Creating an AwsDevice calls the GetDevice API, devices are only created once per ARN
+    return AwsDevice(arn=arn)
+
+
+def run_task(device_arn: str) -> None:
+    device = get_device(device_arn)
     try:
         task = device.run(bell, shots=shots)
         print('{device_name} task {task_state} {task_arn}'.format(
@@ -26,3 +35,8 @@ for device_arn in device_arns:
         )
     except Exception as e:
         print('{device_name}: {error}'.format(device_name=device.name, error=e))
+
+
+# Task creation is a blocking API call, the tasks are created concurrently
+with ThreadPoolExecutor(max_workers=len(device_arns)) as executor:
+    list(executor.map(run_task, device_arns))
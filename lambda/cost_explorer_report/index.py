@@ -1,5 +1,9 @@
+import json
 import os
+import time
 import boto3
+from types import MappingProxyType
+from typing import Optional
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.data_classes import event_source, CloudWatchDashboardCustomWidgetEvent
@@ -9,6 +13,10 @@ from decimal import Decimal, ROUND_HALF_UP
 logger = Logger(log_uncaught_exceptions=True)
 
 cost_explorer = boto3.client('ce')
+report_cache = {}
+
+REPORT_CACHE_TTL = 3600
+REPORT_CACHE_FILE = '/tmp/cost_explorer_report_{}_{}.json'
 
 DOCS = """
 ## Braket Cost Explorer Report Custom Widget
@@ -16,7 +24,7 @@ Queries the AWS Cost Explorer API to get Braket and SageMaker cost and usage inf
 Displays these information in a CloudWatch dashboard custom widget.
 """
 
-MONITORED_SERVICES_INFO = {
+MONITORED_SERVICES_INFO = MappingProxyType({
     'Amazon Braket': {
         'comment': "Includes Braket resource costs like <b>quantum tasks</b>, <b>hybrid jobs</b>, and device <b>reservations</b> (see <a href='https://aws.amazon.com/braket/pricing/'>Amazon Braket Pricing</a>).",
         'amount': '$0.00'
@@ -29,8 +37,23 @@ MONITORED_SERVICES_INFO = {
         'comment': "Includes costs for the <b>GetCostAndUsage</b> API used to display cost data in this widget but also for all other invocations of the AWS Cost Explorer API (see <a href='https://aws.amazon.com/aws-cost-management/aws-cost-explorer/pricing/'>AWS Cost Explorer Pricing</a>).",
         'amount': '$0.00'
     }
-}
+})
 SOLUTION_RESOURCES_INFO = "Tagged resources used by the cost control solution<sup>**</sup>."
+TAG_KEY = os.environ['TAG_KEY']
+
+_HTML_HEADER = """<br>Retrieved using the 
+<a href='https://docs.aws.amazon.com/aws-cost-management/latest/APIReference/API_GetCostAndUsage.html'>GetCostAndUsage</a> API 
+with start date <b>{start_date}</b> and end date <b>{end_date}</b>. Response timestamp: {response_time}.
+<br><br><table>
+<tr><th>Service</th><th>Amount*</th><th>Additional Information</th></tr>
+"""
+_ROW_TMPL = """<tr><td>{service}</td><td>{amount}</td><td>{comment}</td></tr>
+"""
+_HTML_FOOTER = f"""</table>
+<br> <b><sup>*</sup></b>: The table shows <i>unblended</i> costs rounded to $0.01. 
+See <a href='https://aws.amazon.com/blogs/aws-cloud-financial-management/understanding-your-aws-cost-datasets-a-cheat-sheet/'>this blogpost</a> for more information about AWS cost datasets.
+<br> <b><sup>**</sup></b>: To monitor charges for these resources, you need to first <a href='https://docs.aws.amazon.com/awsaccountbilling/latest/aboutv2/custom-tags.html'>activate user-defined cost allocation tags</a> for the tag key "{TAG_KEY}".
+"""
 
 
 @event_source(data_class=CloudWatchDashboardCustomWidgetEvent)
@@ -47,6 +70,12 @@ def handler(event: CloudWatchDashboardCustomWidgetEvent, context: LambdaContext)
             end_date = end_date - timedelta(days=1)
         start_date = end_date.replace(day=1).isoformat()
         end_date = end_date.isoformat()
+        cached_report = get_cached_report(start_date, end_date)
+        if cached_report:
+            logger.info('Return cached report', start_date=start_date, end_date=end_date)
+            return cached_report
+
+        services_info = {key: dict(value) for key, value in MONITORED_SERVICES_INFO.items()}
         response = cost_explorer.get_cost_and_usage(
             TimePeriod={
                 'Start': start_date,
@@ -78,36 +107,45 @@ def handler(event: CloudWatchDashboardCustomWidgetEvent, context: LambdaContext)
                 service = group['Keys'][0]
                 amount = '$' + str(Decimal(group['Metrics'][metric]['Amount']).quantize(Decimal('.01'), ROUND_HALF_UP))
                 comment = SOLUTION_RESOURCES_INFO
-                if MONITORED_SERVICES_INFO.get(service) and MONITORED_SERVICES_INFO.get(service).get('comment'):
-                    comment = MONITORED_SERVICES_INFO.get(service).get('comment')
-                MONITORED_SERVICES_INFO[service] = {
+                if services_info.get(service) and services_info.get(service).get('comment'):
+                    comment = services_info.get(service).get('comment')
+                services_info[service] = {
                     'amount': amount,
                     'comment': comment
                 }
 
-        html = f"""<br>Retrieved using the 
-        <a href='https://docs.aws.amazon.com/aws-cost-management/latest/APIReference/API_GetCostAndUsage.html'>GetCostAndUsage</a> API 
-        with start date <b>{start_date}</b> and end date <b>{end_date}</b>. Response timestamp: {response_time}.
-        """
-        html += "<br><br><table>"
-        html += f"<tr><th>Service</th><th>Amount*</th><th>Additional Information</th></tr>"
-
-        for key, value in MONITORED_SERVICES_INFO.items():
-            html += f"""
-            <tr>
-            <td>{key}</td>
-            <td>{value.get('amount')}</td>
-            <td>{value.get('comment')}</td>
-            </tr>
-            """
-
-        html += "</table>"
-        html += f"""
-        <br> <b><sup>*</sup></b>: The table shows <i>unblended</i> costs rounded to $0.01. 
-        See <a href='https://aws.amazon.com/blogs/aws-cloud-financial-management/understanding-your-aws-cost-datasets-a-cheat-sheet/'>this blogpost</a> for more information about AWS cost datasets.
-        <br> <b><sup>**</sup></b>: To monitor charges for these resources, you need to first <a href='https://docs.aws.amazon.com/awsaccountbilling/latest/aboutv2/custom-tags.html'>activate user-defined cost allocation tags</a> for the tag key "{os.environ['TAG_KEY']}".
-        """
+        rows = [_ROW_TMPL.format(service=key, amount=value.get('amount'), comment=value.get('comment')) for key, value in services_info.items()]
+        html = _HTML_HEADER.format(start_date=start_date, end_date=end_date, response_time=response_time) + ''.join(rows) + _HTML_FOOTER
+        put_cached_report(start_date, end_date, html)
         return html
     except Exception as e:
         logger.exception(e)
         raise
+
+
+def get_cached_report(start_date: str, end_date: str) -> Optional[str]:
+    # Reports are cached in memory and in /tmp to be reused by warm invocations and restarted runtimes
+    # of the same execution environment.
+    key = (start_date, end_date)
+    if key not in report_cache:
+        try:
+            with open(REPORT_CACHE_FILE.format(start_date, end_date)) as cache_file:
+                cached = json.load(cache_file)
+            report_cache[key] = (cached['timestamp'], cached['html'])
+        except (OSError, ValueError, KeyError):
+            return None
+    timestamp, html = report_cache[key]
+    if time.time() - timestamp < REPORT_CACHE_TTL:
+        return html
+    return None
+
+
+def put_cached_report(start_date: str, end_date: str, html: str) -> None:
+    timestamp = time.time()
+    report_cache.clear()
+    report_cache[(start_date, end_date)] = (timestamp, html)
+    try:
+        with open(REPORT_CACHE_FILE.format(start_date, end_date), 'w') as cache_file:
+            json.dump({'timestamp': timestamp, 'html': html}, cache_file)
+    except OSError as e:
+        logger.warning('Failed to persist cached report', error=str(e))
@@ -2,16 +2,19 @@
 # SPDX-License-Identifier: MIT-0
 
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import boto3
 from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities import parameters
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.data_classes import event_source, EventBridgeEvent
 
+CONTROLLED_IDENTITIES_MAX_AGE = 300
+MAX_WORKERS = 32
+
 topic_arn = os.environ['TOPIC_ARN']
 policy_arn = os.environ['POLICY_ARN']
-roles = list(filter(None, os.environ['ROLES'].strip().split(',')))
-groups = list(filter(None, os.environ['GROUPS'].strip().split(',')))
-users = list(filter(None, os.environ['USERS'].strip().split(',')))
+controlled_identities_parameter_name = os.environ['CONTROLLED_IDENTITIES_PARAMETER_NAME']
 
 sns = boto3.client('sns')
 iam = boto3.client('iam')
@@ -26,16 +29,13 @@ def handler(event: EventBridgeEvent, context: LambdaContext) -> None:
         alarm_name = event.detail['alarmName']
         alarm_state = event.detail['state']
         logger.info('Alarm action triggered', alarm_name=alarm_name, alarm_state=alarm_state)
+        roles, groups, users = get_controlled_identities()
         if alarm_state['value'] == 'ALARM':
-            for role in roles:
-                logger.info('Attach policy {} to role {}'.format(policy_arn, role))
-                iam.attach_role_policy(RoleName=role, PolicyArn=policy_arn)
-            for group in groups:
-                logger.info('Attach policy {} to group {}'.format(policy_arn, group))
-                iam.attach_group_policy(GroupName=group, PolicyArn=policy_arn)
-            for user in users:
-                logger.info('Attach policy {} to user {}'.format(policy_arn, user))
-                iam.attach_user_policy(UserName=user, PolicyArn=policy_arn)
+            failed_operations = apply_policy_operations(
+                [('Attach policy {} to role {}'.format(policy_arn, role), iam.attach_role_policy, {'RoleName': role}) for role in roles]
+                + [('Attach policy {} to group {}'.format(policy_arn, group), iam.attach_group_policy, {'GroupName': group}) for group in groups]
+                + [('Attach policy {} to user {}'.format(policy_arn, user), iam.attach_user_policy, {'UserName': user}) for user in users]
+            )
             sns.publish(
                 TopicArn=topic_arn,
                 Subject='Amazon Braket Cost Control Policy Attached',
@@ -47,15 +47,13 @@ def handler(event: EventBridgeEvent, context: LambdaContext) -> None:
                 )
             )
         elif alarm_state['value'] == 'OK':
-            for role in roles:
-                logger.info('Detach policy {} from role {}'.format(policy_arn, role))
-                iam.detach_role_policy(RoleName=role, PolicyArn=policy_arn)
-            for group in groups:
-                logger.info('Detach policy {} from group {}'.format(policy_arn, group))
-                iam.detach_group_policy(GroupName=group, PolicyArn=policy_arn)
-            for user in users:
-                logger.info('Detach policy {} from user {}'.format(policy_arn, user))
-                iam.detach_user_policy(UserName=user, PolicyArn=policy_arn)
+            failed_operations = apply_policy_operations(
+                [('Detach policy {} from role {}'.format(policy_arn, role), iam.detach_role_policy, {'RoleName': role}) for role in roles]
+                + [('Detach policy {} from group {}'.format(policy_arn, group), iam.detach_group_policy, {'GroupName': group}) for group in groups]
+                + [('Detach policy {} from user {}'.format(policy_arn, user), iam.detach_user_policy, {'UserName': user}) for user in users],
+                # Identities the policy is not attached to, e.g. on the first transition to OK, are already in the target state
+                ignored_errors=(iam.exceptions.NoSuchEntityException,)
+            )
             sns.publish(
                 TopicArn=topic_arn,
                 Subject='Amazon Braket Cost Control Policy Detached',
@@ -66,6 +64,47 @@ def handler(event: EventBridgeEvent, context: LambdaContext) -> None:
                     ','.join(users)
                 )
             )
+        else:
+            failed_operations = []
+        if failed_operations:
+            raise RuntimeError('Failed operations: {}'.format('; '.join(failed_operations)))
     except Exception as e:
         logger.exception(e)
         raise
+
+
+def get_controlled_identities() -> tuple:
+    # The parameter value is cached for the lifetime of the execution environment up to the max age.
+    # Empty and duplicate names are dropped to avoid failing or repeated IAM calls for the same identity.
+    identities = parameters.get_parameter(
+        controlled_identities_parameter_name,
+        transform='json',
+        max_age=CONTROLLED_IDENTITIES_MAX_AGE
+    )
+    return tuple(
+        tuple(dict.fromkeys(filter(None, (name.strip() for name in identities[key]))))
+        for key in ('roles', 'groups', 'users')
+    )
+
+
+def apply_policy_operations(operations: list, ignored_errors: tuple = ()) -> list:
+    # IAM calls for the individual identities are independent and run concurrently. A failure for one identity
+    # does not abort the operations for the others, the descriptions of failed operations are returned instead.
+    # Errors of the ignored types mean the identity is already in the target state and are not counted as failures.
+    def apply(description, operation, identity):
+        logger.info(description)
+        try:
+            operation(PolicyArn=policy_arn, **identity)
+        except ignored_errors as e:
+            logger.info('Skip operation, policy state unchanged', operation=description, error=str(e))
+
+    failed_operations = []
+    if not operations:
+        return failed_operations
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(operations))) as executor:
+        futures = {executor.submit(apply, *operation): operation[0] for operation in operations}
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                logger.error('Operation failed', operation=futures[future], error=str(future.exception()))
+                failed_operations.append(futures[future])
+    return failed_operations
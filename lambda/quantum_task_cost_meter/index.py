@@ -2,104 +2,197 @@
 # SPDX-License-Identifier: MIT-0
 
 import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from decimal import Decimal
-from dateutil import parser
 import boto3
+from botocore.config import Config
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import event_parser
 from models import CostMeterStreamModel, TaskTableRecordModel
 
 ALL_TIME = 'all_time'
+METRIC_NAMESPACE = '/aws/braket'
+# Maximum number of values of a metric in an embedded metric format document
+EMF_MAX_VALUES = 100
 
-cloudwatch = boto3.client('cloudwatch')
-dynamodb = boto3.client('dynamodb')
+COST_BIN_COUNT = 4
+COST_BIN_UPDATE_EXPRESSION = 'SET cost = if_not_exists(cost, :initial_cost) + :task_cost, last_task_execution = :task_execution'
+INITIAL_COST = {'N': '0'}
+
+# Bin updates are not idempotent, the default read timeout keeps slow updates from being retried and applied twice
+dynamodb = boto3.client('dynamodb', config=Config(
+    max_pool_connections=2 * COST_BIN_COUNT,
+    tcp_keepalive=True,
+    connect_timeout=1,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+))
 cost_table_name = os.environ['COST_TABLE_NAME']
+# The cost bins of a record are updated concurrently, the executor is reused by warm invocations
+executor = ThreadPoolExecutor(max_workers=COST_BIN_COUNT)
 
 logger = Logger(log_uncaught_exceptions=True)
 
 
 @event_parser(model=CostMeterStreamModel)
 @logger.inject_lambda_context()
-def handler(event: CostMeterStreamModel, context: LambdaContext) -> None:
+def handler(event: CostMeterStreamModel, context: LambdaContext) -> dict:
     try:
+        metric_data = []
+        batch_item_failures = []
+        batch_aggregated_cost = {}
+        batch_task_cost = Decimal(0)
         for record in event.Records:
-            data: TaskTableRecordModel = record.dynamodb.NewImage
-            task_execution = data.task_execution.S
-            user_arn = data.user_identity.S
-            device_arn = data.device_arn.S
-            month = parser.parse(task_execution).strftime('%Y-%m')
-            month_user = '{month}_{user}'.format(month=month, user=user_arn)
-            month_device = '{month}_{device}'.format(month=month, device=device_arn)
-            bins = [ALL_TIME, month, month_user, month_device]
-            aggregated_cost = {}
-            for cost_bin in bins:
-                response = dynamodb.update_item(
-                    TableName=cost_table_name,
-                    Key={'bin': {'S': cost_bin}},
-                    UpdateExpression='SET cost = if_not_exists(cost, :initial_cost) + :task_cost, last_task_execution = :task_execution',
-                    ExpressionAttributeValues={
-                        ':task_cost': {'N': data.cost.N},
-                        ':initial_cost': {'N': '0'},
-                        ':task_execution': {'S': task_execution},
-                    },
-                    ReturnValues='ALL_NEW'
-                )
-                aggregated_cost[response['Attributes']['bin']['S']] = response['Attributes']['cost']['N']
-            logger.info('Aggregate cost', extra=aggregated_cost)
-            timestamp = parser.parse(task_execution).timestamp()
-            task_cost = Decimal(data.cost.N)
-            cloudwatch.put_metric_data(
-                Namespace='/aws/braket',
-                MetricData=[
-                    {
-                        'MetricName': 'QuantumTaskCost',
-                        'Timestamp': timestamp,
-                        'Value': task_cost,
-                        'Unit': 'Count',
-                        'Dimensions': [
-                            {'Name': 'User Identity', 'Value': user_arn},
-                            {'Name': 'Device', 'Value': device_arn}
-                        ]
-                    },
-                    {
-                        'MetricName': 'QuantumTaskCost',
-                        'Timestamp': timestamp,
-                        'Value': task_cost,
-                        'Unit': 'Count',
-                    },
-                    {
-                        'MetricName': 'AggregatedQuantumTaskCostAllTime',
-                        'Timestamp': timestamp,
-                        'Value': Decimal(aggregated_cost[ALL_TIME]),
-                        'Unit': 'Count',
-                    },
-                    {
-                        'MetricName': 'AggregatedQuantumTaskCostMonth',
-                        'Timestamp': timestamp,
-                        'Value': Decimal(aggregated_cost[month]),
-                        'Unit': 'Count',
-                    },
-                    {
-                        'MetricName': 'AggregatedQuantumTaskCostMonth',
-                        'Timestamp': timestamp,
-                        'Value': Decimal(aggregated_cost[month_user]),
-                        'Unit': 'Count',
-                        'Dimensions': [
-                            {'Name': 'User Identity', 'Value': user_arn}
-                        ]
-                    },
-                    {
-                        'MetricName': 'AggregatedQuantumTaskCostMonth',
-                        'Timestamp': timestamp,
-                        'Value': Decimal(aggregated_cost[month_device]),
-                        'Unit': 'Count',
-                        'Dimensions': [
-                            {'Name': 'Device', 'Value': device_arn}
-                        ]
-                    },
-                ]
-            )
+            try:
+                aggregated_cost, record_metric_data = meter_record(data=record.dynamodb.NewImage)
+            except Exception as e:
+                # The bin updates are not idempotent, the batch is retried from the first failed record only
+                logger.exception(e)
+                batch_item_failures.append({'itemIdentifier': record.dynamodb.SequenceNumber})
+                break
+            batch_aggregated_cost.update(aggregated_cost)
+            batch_task_cost += Decimal(record.dynamodb.NewImage.cost.N)
+            metric_data.extend(record_metric_data)
+        logger.info(
+            'Aggregate cost',
+            records=len(event.Records),
+            failed_records=len(batch_item_failures),
+            task_cost=str(batch_task_cost),
+            extra=batch_aggregated_cost
+        )
+        emit_metric_data(metric_data=metric_data)
+        return {'batchItemFailures': batch_item_failures}
     except Exception as e:
         logger.exception(e)
         raise
+
+
+def meter_record(data: TaskTableRecordModel) -> tuple:
+    task_execution = data.task_execution.S
+    user_arn = data.user_identity.S
+    device_arn = data.device_arn.S
+    # task_execution is written in ISO 8601 format by the task logger
+    task_execution_time = datetime.fromisoformat(task_execution)
+    month = task_execution_time.strftime('%Y-%m')
+    month_user = '{month}_{user}'.format(month=month, user=user_arn)
+    month_device = '{month}_{device}'.format(month=month, device=device_arn)
+    # Bins are single items, not sharded counters: the budget alarms need the exact aggregate returned by the
+    # update, and quantum task rates stay far below the per item write throughput of a DynamoDB partition
+    bins = [ALL_TIME, month, month_user, month_device]
+    # The update values are the same for all bins of the record
+    expression_attribute_values = {
+        ':task_cost': {'N': data.cost.N},
+        ':initial_cost': INITIAL_COST,
+        ':task_execution': {'S': task_execution},
+    }
+    aggregated_cost = dict(executor.map(
+        lambda cost_bin: update_cost_bin(cost_bin=cost_bin, expression_attribute_values=expression_attribute_values),
+        bins
+    ))
+    logger.debug('Aggregate cost', extra=aggregated_cost)
+    timestamp = task_execution_time.timestamp()
+    task_cost = float(data.cost.N)
+    metric_data = [
+        {
+            'MetricName': 'QuantumTaskCost',
+            'Timestamp': timestamp,
+            'Value': task_cost,
+            'Unit': 'Count',
+            'Dimensions': [
+                {'Name': 'User Identity', 'Value': user_arn},
+                {'Name': 'Device', 'Value': device_arn}
+            ]
+        },
+        {
+            'MetricName': 'QuantumTaskCost',
+            'Timestamp': timestamp,
+            'Value': task_cost,
+            'Unit': 'Count',
+        },
+        {
+            'MetricName': 'AggregatedQuantumTaskCostAllTime',
+            'Timestamp': timestamp,
+            'Value': float(aggregated_cost[ALL_TIME]),
+            'Unit': 'Count',
+        },
+        {
+            'MetricName': 'AggregatedQuantumTaskCostMonth',
+            'Timestamp': timestamp,
+            'Value': float(aggregated_cost[month]),
+            'Unit': 'Count',
+        },
+        {
+            'MetricName': 'AggregatedQuantumTaskCostMonth',
+            'Timestamp': timestamp,
+            'Value': float(aggregated_cost[month_user]),
+            'Unit': 'Count',
+            'Dimensions': [
+                {'Name': 'User Identity', 'Value': user_arn}
+            ]
+        },
+        {
+            'MetricName': 'AggregatedQuantumTaskCostMonth',
+            'Timestamp': timestamp,
+            'Value': float(aggregated_cost[month_device]),
+            'Unit': 'Count',
+            'Dimensions': [
+                {'Name': 'Device', 'Value': device_arn}
+            ]
+        },
+    ]
+    return aggregated_cost, metric_data
+
+
+def update_cost_bin(cost_bin: str, expression_attribute_values: dict) -> tuple:
+    # Bins are updated with individual concurrent UpdateItem calls rather than TransactWriteItems: a
+    # transaction does not return the updated items, consumes twice the write capacity and conflicts
+    # with concurrent batches updating the shared all time and month bins.
+    response = dynamodb.update_item(
+        TableName=cost_table_name,
+        Key={'bin': {'S': cost_bin}},
+        UpdateExpression=COST_BIN_UPDATE_EXPRESSION,
+        ExpressionAttributeValues=expression_attribute_values,
+        ReturnValues='ALL_NEW'
+    )
+    return response['Attributes']['bin']['S'], response['Attributes']['cost']['N']
+
+
+def emit_metric_data(metric_data: list) -> None:
+    # Metric data is written to stdout in CloudWatch embedded metric format, from which
+    # CloudWatch Logs extracts the metrics asynchronously without PutMetricData API calls.
+    # Datums with the same timestamp and dimensions are combined into one document, values of
+    # the same metric as an array of up to EMF_MAX_VALUES values.
+    documents = {}
+    for datum in metric_data:
+        dimensions = {dimension['Name']: dimension['Value'] for dimension in datum.get('Dimensions', [])}
+        documents_for_key = documents.setdefault((datum['Timestamp'], tuple(dimensions.items())), [])
+        for document in documents_for_key:
+            if len(document['metrics'].get(datum['MetricName'], {'values': []})['values']) < EMF_MAX_VALUES:
+                break
+        else:
+            document = {'timestamp': datum['Timestamp'], 'dimensions': dimensions, 'metrics': {}}
+            documents_for_key.append(document)
+        metric = document['metrics'].setdefault(datum['MetricName'], {'unit': datum['Unit'], 'values': []})
+        metric['values'].append(datum['Value'])
+    if not documents:
+        return
+    print('\n'.join(
+        json.dumps({
+            '_aws': {
+                'Timestamp': int(document['timestamp'] * 1000),
+                'CloudWatchMetrics': [
+                    {
+                        'Namespace': METRIC_NAMESPACE,
+                        'Dimensions': [list(document['dimensions'].keys())],
+                        'Metrics': [{'Name': name, 'Unit': metric['unit']} for name, metric in document['metrics'].items()]
+                    }
+                ]
+            },
+            **document['dimensions'],
+            **{name: metric['values'] if len(metric['values']) > 1 else metric['values'][0] for name, metric in document['metrics'].items()}
+        })
+        for documents_for_key in documents.values()
+        for document in documents_for_key
+    ))
@@ -2,22 +2,36 @@
 # SPDX-License-Identifier: MIT-0
 
 import os
+import functools
+from collections import OrderedDict
 import boto3
+from botocore.config import Config
 from datetime import timedelta, datetime
-from braket.aws import AwsQuantumTask
+from braket.aws import AwsQuantumTask, AwsSession
 from braket.tracking import tracker
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import event_parser
 from models import TaskLoggerModel, QuantumTaskStateModel, CreateQuantumTaskModel
 
+RECORDED_TASKS_MAX_SIZE = 10000
+
 ttl_attribute_name = os.environ['TTL_ATTRIBUTE_NAME']
-task_item_ttl_days = os.environ['TASK_ITEM_TTL_DAYS']
+task_item_ttl = timedelta(days=int(os.environ['TASK_ITEM_TTL_DAYS']))
 tasks_table_name = os.environ['TASKS_TABLE_NAME']
-dynamodb = boto3.client('dynamodb')
+dynamodb = boto3.client('dynamodb', config=Config(
+    tcp_keepalive=True,
+    connect_timeout=1,
+    read_timeout=3,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+))
 
 logger = Logger(log_uncaught_exceptions=True)
 
+# Recorded (attribute, task ARN) pairs of this execution environment, used to skip repeated
+# conditional writes for duplicate events
+recorded_tasks = OrderedDict()
+
 
 @logger.inject_lambda_context()
 @event_parser(model=TaskLoggerModel)
@@ -32,13 +46,16 @@ def handler(event: TaskLoggerModel, context: LambdaContext) -> None:
         )
 
         if event.get_status() == 'INITIALIZED':
-            record_task_user_identity(event_time=event.time, task_data=event.detail)
+            if not is_task_recorded(attribute='user_identity', task_arn=event.get_task_arn()):
+                record_task_user_identity(event_time=event.time, task_data=event.detail)
         elif (event.get_status() == 'RUNNING' or event.get_status() == 'COMPLETED') and event.is_qpu_task():
-            task_cost = calculate_qpu_task_cost(task_data=event.detail)
-            record_task_cost(event_time=event.time, task_cost=task_cost, task_data=event.detail)
+            if not is_task_recorded(attribute='cost', task_arn=event.get_task_arn()):
+                task_cost = calculate_qpu_task_cost(task_data=event.detail)
+                record_task_cost(event_time=event.time, task_cost=task_cost, task_data=event.detail)
         elif event.get_status() == 'COMPLETED' and event.is_simulator_task():
-            task_cost = calculate_simulator_task_cost(task_data=event.detail)
-            record_task_cost(event_time=event.time, task_cost=task_cost, task_data=event.detail)
+            if not is_task_recorded(attribute='cost', task_arn=event.get_task_arn()):
+                task_cost = calculate_simulator_task_cost(task_data=event.detail)
+                record_task_cost(event_time=event.time, task_cost=task_cost, task_data=event.detail)
     except Exception as e:
         logger.exception(e)
         raise
@@ -46,10 +63,12 @@ def handler(event: TaskLoggerModel, context: LambdaContext) -> None:
 
 def calculate_qpu_task_cost(task_data: QuantumTaskStateModel) -> str:
     task = get_task_from_arn(arn=task_data.quantumTaskArn)
+    # The tracker does not retrieve the metadata itself, all task details are derived from a single request
+    metadata = task.metadata()
     details = {
         'status': task_data.status,
         'device': task_data.deviceArn,
-        'job_task': 'jobArn' in task.metadata(),
+        'job_task': 'jobArn' in metadata,
         'shots': task_data.shots,
     }
     # noinspection PyProtectedMember
@@ -60,11 +79,14 @@ def calculate_qpu_task_cost(task_data: QuantumTaskStateModel) -> str:
 
 def calculate_simulator_task_cost(task_data: QuantumTaskStateModel) -> str:
     task = get_task_from_arn(arn=task_data.quantumTaskArn)
+    # The result location is part of the task metadata, with the metadata retrieved first the result
+    # is downloaded directly and the metadata is not requested again
+    metadata = task.metadata()
     execution_duration = task.result().additional_metadata.simulatorMetadata.executionDuration
     details = {
         'status': task_data.status,
         'device': task_data.deviceArn,
-        'job_task': 'jobArn' in task.metadata(),
+        'job_task': 'jobArn' in metadata,
         'execution_duration': str(execution_duration),
         'billed_duration': max(timedelta(milliseconds=execution_duration), tracker.MIN_SIMULATOR_DURATION)
     }
@@ -75,10 +97,15 @@ def calculate_simulator_task_cost(task_data: QuantumTaskStateModel) -> str:
 
 
 def get_task_from_arn(arn: str) -> AwsQuantumTask:
-    # noinspection PyProtectedMember
-    aws_session = AwsQuantumTask._aws_session_for_task_arn(task_arn=arn)
+    return AwsQuantumTask(arn=arn, aws_session=get_aws_session(region=arn.split(':')[3]))
+
+
+@functools.lru_cache(maxsize=None)
+def get_aws_session(region: str) -> AwsSession:
+    # Sessions are created once per quantum task region and reused by warm invocations
+    aws_session = AwsSession(boto_session=boto3.Session(region_name=region))
     aws_session.add_braket_user_agent(os.environ['SOLUTION_ID'])
-    return AwsQuantumTask(arn=arn, aws_session=aws_session)
+    return aws_session
 
 
 def record_task_cost(event_time: datetime, task_cost: str, task_data: QuantumTaskStateModel) -> None:
@@ -86,7 +113,7 @@ def record_task_cost(event_time: datetime, task_cost: str, task_data: QuantumTas
     device_arn = task_data.deviceArn
     task_arn = task_data.quantumTaskArn
     shots = task_data.shots
-    task_ttl = str((event_time + timedelta(days=int(task_item_ttl_days))).timestamp())
+    task_ttl = str((event_time + task_item_ttl).timestamp())
     event_time = event_time.isoformat(sep='T')
     logger.info(
         'Record cost',
@@ -122,6 +149,7 @@ def record_task_cost(event_time: datetime, task_cost: str, task_data: QuantumTas
             task_arn=task_arn,
             task_cost=task_cost
         )
+    mark_task_recorded(attribute='cost', task_arn=task_arn)
 
 
 def record_task_user_identity(event_time: datetime, task_data: CreateQuantumTaskModel) -> None:
@@ -159,3 +187,19 @@ def record_task_user_identity(event_time: datetime, task_data: CreateQuantumTask
             task_arn=task_arn,
             user_identity=user_identity
         )
+    mark_task_recorded(attribute='user_identity', task_arn=task_arn)
+
+
+def is_task_recorded(attribute: str, task_arn: str) -> bool:
+    if (attribute, task_arn) in recorded_tasks:
+        recorded_tasks.move_to_end((attribute, task_arn))
+        logger.debug('Task already recorded', attribute=attribute, task_arn=task_arn)
+        return True
+    return False
+
+
+def mark_task_recorded(attribute: str, task_arn: str) -> None:
+    recorded_tasks[(attribute, task_arn)] = None
+    recorded_tasks.move_to_end((attribute, task_arn))
+    if len(recorded_tasks) > RECORDED_TASKS_MAX_SIZE:
+        recorded_tasks.popitem(last=False)
@@ -1,6 +1,7 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: MIT-0
 
+from functools import cached_property
 from typing import Union
 from aws_lambda_powertools.utilities.parser.models import EventBridgeModel
 from aws_lambda_powertools.utilities.parser import BaseModel
@@ -42,15 +43,19 @@ class TaskLoggerModel(EventBridgeModel):
     def get_device_arn(self):
         return self.detail.deviceArn if isinstance(self.detail, QuantumTaskStateModel) else self.detail.requestParameters.deviceArn
 
-    def get_device_type(self):
+    @cached_property
+    def device_type(self):
         device_arn = self.get_device_arn()
-        return device_arn.split('/')[1]
+        return device_arn.split('/', 2)[1]
+
+    def get_device_type(self):
+        return self.device_type
 
     def is_qpu_task(self):
-        return self.get_device_type() == 'qpu'
+        return self.device_type == 'qpu'
 
     def is_simulator_task(self):
-        return self.get_device_type() == 'quantum-simulator'
+        return self.device_type == 'quantum-simulator'
 
     def get_task_arn(self):
         return self.detail.quantumTaskArn if isinstance(self.detail, QuantumTaskStateModel) else self.detail.responseElements.quantumTaskArn